@@ -0,0 +1,12 @@
+import pytest
+
+
+@pytest.fixture(scope='session')
+def django_db_modify_db_settings(request):
+    """Keep the reused pytest database apart from manage.py test's one"""
+    from django.conf import settings
+
+    db_settings = settings.DATABASES['default']
+    db_settings.setdefault('TEST', {})
+    db_settings['TEST']['NAME'] = 'test_{}_pytest'.format(db_settings['NAME'])
+    request.getfixturevalue('django_db_modify_db_settings_xdist_suffix')
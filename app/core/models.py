@@ -52,7 +52,7 @@ class Tag(models.Model):
 
 class Ingredient(models.Model):
     """Ingredient to be used in a recipe"""
-    name = models.CharField(max_length=255)
+    name = models.CharField(max_length=255, db_index=True)
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE
@@ -1,16 +1,20 @@
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.urls import reverse
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
 from rest_framework import status
 from rest_framework.test import APIClient
 from core.models import Ingredient
-from recipe.serializers import IngredientSerializer
 
 
+User = get_user_model()
+
 INGREDIENTS_URL = reverse('recipe:ingredient-list')
 
+TEST_PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 
-class PublicIngredientsApiTest(TestCase):
+class PublicIngredientsApiTest(SimpleTestCase):
     """Test ingredients API"""
 
     def setUp(self):
@@ -23,46 +27,54 @@ class PublicIngredientsApiTest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@override_settings(PASSWORD_HASHERS=TEST_PASSWORD_HASHERS)
 class PrivateIndgredientsApiTests(TestCase):
     """Test ingredients API"""
 
+    @classmethod
+    def setUpTestData(cls):
+        password = make_password('testpass')
+        cls.user, cls.user2 = User.objects.bulk_create([
+            User(email='test@claiborne.com', password=password),
+            User(email='other@claiborne.com', password=password)
+        ])
+        cls.api_client = APIClient()
+
     def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
-          'test@claiborne.com',
-          'testpass'
-        )
+        self.client = self.api_client
         self.client.force_authenticate(self.user)
 
     def test_retrieve_ingredient_list(self):
         """Test retrieing a list of ingredients"""
-        Ingredient.objects.create(user=self.user, name='Kale')
-        Ingredient.objects.create(user=self.user, name='Salt')
-        response = self.client.get(INGREDIENTS_URL)
+        Ingredient.objects.bulk_create([
+            Ingredient(user=self.user, name='Kale'),
+            Ingredient(user=self.user, name='Salt')
+        ])
+        with self.assertNumQueries(1):
+            response = self.client.get(INGREDIENTS_URL)
         ingredients = Ingredient.objects.all().order_by('-name')
-        serializer = IngredientSerializer(ingredients, many=True)
+        expected = [{'id': i.id, 'name': i.name} for i in ingredients]
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(list(response.data), expected)
 
     def test_indgredients_limited_to_user(self):
         """Test only ingredients for the authenticated user are returned"""
-        user2 = get_user_model().objects.create_user(
-            'other@claiborne.com',
-            'testpass'
-        )
-        Ingredient.objects.create(user=user2, name='Vinegar')
+        Ingredient.objects.create(user=self.user2, name='Vinegar')
         ingredient = Ingredient.objects.create(user=self.user, name='Tumeric')
-        response = self.client.get(INGREDIENTS_URL)
+        with self.assertNumQueries(1):
+            response = self.client.get(INGREDIENTS_URL)
+        data = list(response.data)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['name'], ingredient.name)
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]['name'], ingredient.name)
 
     def test_create_ingredient_successful(self):
         """Test create new ingredient"""
         payload = {'name': 'Cabbage'}
-        self.client.post(INGREDIENTS_URL, payload)
+        self.client.post(INGREDIENTS_URL, payload, format='json')
+        # user and name each carry an index, so this stays cheap
         exists = Ingredient.objects.filter(
             user=self.user,
             name=payload['name']
@@ -73,6 +85,6 @@ class PrivateIndgredientsApiTests(TestCase):
     def test_create_ingredient_invalid(self):
         """Test creating invalid ingredient fails"""
         payload = {'name': ''}
-        response = self.client.post(INGREDIENTS_URL, payload)
+        response = self.client.post(INGREDIENTS_URL, payload, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -1,18 +1,23 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
 
+User = get_user_model()
+
 CREATE_USER_URL = reverse('user:create')
 TOKEN_URL = reverse('user:token')
 ME_URL = reverse('user:me')
 
+TEST_PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 
 def create_user(**params):
-    return get_user_model().objects.create_user(**params)
+    return User.objects.create_user(**params)
 
 
+@override_settings(PASSWORD_HASHERS=TEST_PASSWORD_HASHERS)
 class PublicUserAPITests(TestCase):
     """Test users API"""
 
@@ -26,10 +31,10 @@ class PublicUserAPITests(TestCase):
             'password': 'testpass',
             'name': 'Full Name'
         }
-        response = self.client.post(CREATE_USER_URL, payload)
+        response = self.client.post(CREATE_USER_URL, payload, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        user = get_user_model().objects.get(**response.data)
+        user = User.objects.get(**response.data)
         self.assertTrue(user.check_password(payload['password']))
         self.assertNotIn('password', response.data)
 
@@ -37,17 +42,18 @@ class PublicUserAPITests(TestCase):
         """Creating a user that already exists fails"""
         payload = {'email': 'test@claiborne.com', 'password': 'passtest'}
         create_user(**payload)
-        response = self.client.post(CREATE_USER_URL, payload)
+        response = self.client.post(CREATE_USER_URL, payload, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_password_too_short(self):
         """Test password must be more than 5 characters"""
         payload = {'email': 'test@claiborne.com', 'password': 'ppppp'}
-        response = self.client.post(CREATE_USER_URL, payload)
+        response = self.client.post(CREATE_USER_URL, payload, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        user_exists = get_user_model().objects.filter(
+        # email is unique, and therefore indexed, so this stays cheap
+        user_exists = User.objects.filter(
             email=payload['email']
         ).exists()
         self.assertFalse(user_exists)
@@ -56,35 +62,29 @@ class PublicUserAPITests(TestCase):
         """Test a token is created for user"""
         payload = {'email': 'test@claiborne.com', 'password': 'testpass'}
         create_user(**payload)
-        response = self.client.post(TOKEN_URL, payload)
+        response = self.client.post(TOKEN_URL, payload, format='json')
 
         self.assertIn('token', response.data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-    def test_create_token_with_invalid_credentials(self):
-        """Test token is not created if invalid credentials given"""
+    def test_create_token_invalid_request(self):
+        """Test token is not created for invalid credentials or fields"""
         create_user(email='test@claiborne.com', password='testpass')
-        payload = {'email': 'test@claiborne.com', 'password': 'wrong'}
-        response = self.client.post(TOKEN_URL, payload)
-
-        self.assertNotIn('token', response.data)
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-
-    def test_create_token_with_no_user(self):
-        """Test token is not created if no user is given"""
-        payload = {'email': 'test@claiborne.com', 'password': 'testpass'}
-        response = self.client.post(TOKEN_URL, payload)
-
-        self.assertNotIn('token', response.data)
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-
-    def test_create_token_with_no_fields(self):
-        """Test email and password fields are required"""
-        payload = {'email': 'one', 'password': ''}
-        response = self.client.post(TOKEN_URL, payload)
-
-        self.assertNotIn('token', response.data)
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        payloads = [
+            {'email': 'test@claiborne.com', 'password': 'wrong'},
+            {'email': 'other@claiborne.com', 'password': 'testpass'},
+            {'email': 'one', 'password': ''},
+        ]
+
+        for payload in payloads:
+            with self.subTest(payload=payload):
+                response = self.client.post(TOKEN_URL, payload, format='json')
+
+                self.assertNotIn('token', response.data)
+                self.assertEqual(
+                    response.status_code,
+                    status.HTTP_400_BAD_REQUEST
+                )
 
     def test_retrieve_user_unauthorized(self):
         """Test authentication is required for users"""
@@ -94,16 +94,22 @@ class PublicUserAPITests(TestCase):
 
 
 
+@override_settings(PASSWORD_HASHERS=TEST_PASSWORD_HASHERS)
 class PrivateUserAPITests(TestCase):
     """Test API requests that require authentication"""
 
-    def setUp(self):
-        self.user = create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email='test1@claiborne.com',
             password='testpass',
             name='Full Name'
         )
-        self.client = APIClient()
+        cls.api_client = APIClient()
+
+    def setUp(self):
+        self.user = User.objects.get(pk=self.user.pk)
+        self.client = self.api_client
         self.client.force_authenticate(user=self.user)
 
     def test_retrieve_profile_success(self):
@@ -118,15 +124,15 @@ class PrivateUserAPITests(TestCase):
 
     def test_post_me_not_allowed(self):
         """Test POST is not allowed on me url"""
-        response = self.client.post(ME_URL, {})
+        response = self.client.post(ME_URL, {}, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
 
     def test_update_user_profile(self):
         """Test updating user profile for authenticated user"""
         payload = {'name': 'New Name', 'password': 'anewpassword'}
-        response = self.client.patch(ME_URL, payload)
-        self.user.refresh_from_db()
+        response = self.client.patch(ME_URL, payload, format='json')
+        self.user.refresh_from_db(fields=['name', 'password'])
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(self.user.name, payload['name'])